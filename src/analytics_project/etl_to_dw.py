@@ -13,7 +13,9 @@ Author: Graduate BI Project Team
 Date: November 2025
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import sqlite3
 import logging
 from pathlib import Path
@@ -42,6 +44,134 @@ except ImportError:
         return logger
 
 
+# Star schema DDL. Each block runs as one executescript call; the connection is in
+# autocommit mode, so executescript does not commit the ETL's open transaction.
+DIMENSION_TABLES_SQL = """
+-- Platform Dimension
+CREATE TABLE IF NOT EXISTS platform_dim (
+    platform_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    platform_name TEXT UNIQUE NOT NULL,
+    platform_category TEXT,
+    created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Genre Dimension
+CREATE TABLE IF NOT EXISTS genre_dim (
+    genre_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    genre_name TEXT UNIQUE NOT NULL,
+    created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Publisher Dimension
+CREATE TABLE IF NOT EXISTS publisher_dim (
+    publisher_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    publisher_name TEXT UNIQUE NOT NULL,
+    publisher_size_category TEXT,
+    created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Time Dimension
+CREATE TABLE IF NOT EXISTS time_dim (
+    time_id INTEGER PRIMARY KEY,
+    year INTEGER NOT NULL,
+    decade INTEGER NOT NULL,
+    era TEXT NOT NULL,
+    created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Game Dimension (Degenerate dimension from fact table). Like the fact table it
+-- has no created_date: a per-row CURRENT_TIMESTAMP default is pure load overhead
+CREATE TABLE IF NOT EXISTS game_dim (
+    game_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_name TEXT NOT NULL,
+    platform_id INTEGER,
+    genre_id INTEGER,
+    publisher_id INTEGER,
+    release_year INTEGER,
+    success_category TEXT,
+    multi_region_success BOOLEAN,
+    FOREIGN KEY (platform_id) REFERENCES platform_dim (platform_id),
+    FOREIGN KEY (genre_id) REFERENCES genre_dim (genre_id),
+    FOREIGN KEY (publisher_id) REFERENCES publisher_dim (publisher_id)
+);
+"""
+
+FACT_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS game_sales_fact (
+    fact_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_id INTEGER NOT NULL,
+    platform_id INTEGER NOT NULL,
+    genre_id INTEGER NOT NULL,
+    publisher_id INTEGER NOT NULL,
+    time_id INTEGER NOT NULL,
+    
+    -- Sales Metrics (Measures)
+    global_sales REAL NOT NULL,
+    na_sales REAL NOT NULL,
+    eu_sales REAL NOT NULL,
+    jp_sales REAL NOT NULL,
+    other_sales REAL NOT NULL,
+    
+    -- Derived Metrics
+    na_sales_pct REAL,
+    eu_sales_pct REAL,
+    jp_sales_pct REAL,
+    other_sales_pct REAL,
+    
+    -- Foreign Key Constraints
+    FOREIGN KEY (game_id) REFERENCES game_dim (game_id),
+    FOREIGN KEY (platform_id) REFERENCES platform_dim (platform_id),
+    FOREIGN KEY (genre_id) REFERENCES genre_dim (genre_id),
+    FOREIGN KEY (publisher_id) REFERENCES publisher_dim (publisher_id),
+    FOREIGN KEY (time_id) REFERENCES time_dim (time_id)
+    
+    -- The composite unique key is built by INDEXES_SQL after the load
+);
+"""
+
+# Composite key of the fact table. A full load builds it with the other indexes
+# after the insert; a chunked load needs it during the insert to drop duplicates
+FACT_UNIQUE_INDEX_SQL = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_fact_unique
+    ON game_sales_fact(game_id, platform_id, genre_id, publisher_id, time_id);
+"""
+
+# Built once after the bulk load instead of being maintained per INSERT
+INDEXES_SQL = FACT_UNIQUE_INDEX_SQL + """
+-- Fact table indexes
+CREATE INDEX IF NOT EXISTS idx_fact_game ON game_sales_fact(game_id);
+CREATE INDEX IF NOT EXISTS idx_fact_platform ON game_sales_fact(platform_id);
+CREATE INDEX IF NOT EXISTS idx_fact_genre ON game_sales_fact(genre_id);
+CREATE INDEX IF NOT EXISTS idx_fact_publisher ON game_sales_fact(publisher_id);
+CREATE INDEX IF NOT EXISTS idx_fact_time ON game_sales_fact(time_id);
+CREATE INDEX IF NOT EXISTS idx_fact_global_sales ON game_sales_fact(global_sales);
+
+-- Dimension table indexes
+CREATE INDEX IF NOT EXISTS idx_platform_name ON platform_dim(platform_name);
+CREATE INDEX IF NOT EXISTS idx_genre_name ON genre_dim(genre_name);
+CREATE INDEX IF NOT EXISTS idx_publisher_name ON publisher_dim(publisher_name);
+CREATE INDEX IF NOT EXISTS idx_time_year ON time_dim(year);
+CREATE INDEX IF NOT EXISTS idx_game_name ON game_dim(game_name);
+"""
+
+# (select, insert) statements for the name-keyed dimensions, written out in full
+# rather than formatted from the dimension name
+NAMED_DIMENSION_SQL = {
+    'platform': (
+        "SELECT platform_name, platform_id FROM platform_dim",
+        "INSERT INTO platform_dim (platform_name) VALUES (?)",
+    ),
+    'genre': (
+        "SELECT genre_name, genre_id FROM genre_dim",
+        "INSERT INTO genre_dim (genre_name) VALUES (?)",
+    ),
+    'publisher': (
+        "SELECT publisher_name, publisher_id FROM publisher_dim",
+        "INSERT INTO publisher_dim (publisher_name) VALUES (?)",
+    ),
+}
+
+
 class VideoGameDataWarehouse:
     """Handles ETL process to load video game data into SQLite data warehouse."""
     
@@ -61,6 +191,7 @@ class VideoGameDataWarehouse:
         self.data_dir = self.project_root / "data"
         self.dw_dir = self.data_dir / "dw"
         self.cleaned_data_path = self.data_dir / "prepared" / "vgsales_cleaned.csv"
+        self.cleaned_parquet_path = self.cleaned_data_path.with_suffix(".parquet")
         self.dw_path = self.dw_dir / "video_games_dw.sqlite"
         
         # Ensure directories exist
@@ -69,22 +200,123 @@ class VideoGameDataWarehouse:
         # Setup logging
         self.logger = setup_logger("etl_to_dw")
         
+        # Natural key identifying a game in game_dim
+        self.game_key = ['Name', 'platform_id', 'genre_id', 'publisher_id']
+        
+        # Explicit dtypes for the cleaned CSV, matching what data_prep exports
+        sales_columns = ['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales', 'Global_Sales']
+        self.cleaned_dtypes = {
+            'Rank': 'int32',
+            'Name': 'object',
+            'Platform': 'category',
+            'Year': 'Int16',
+            'Genre': 'category',
+            'Publisher': 'category',
+            **dict.fromkeys(sales_columns, 'float32'),
+            'Decade': 'Int16',
+            'Era': 'category',
+            'Success_Category': 'category',
+            'Multi_Region_Success': 'boolean',
+        }
+        
+        # game_id of every game loaded so far in a chunked run (natural key tuple -> ID),
+        # so a game keeps one game_id across chunks; None when the load is one frame
+        self._loaded_games = None
+        
     def create_connection(self) -> sqlite3.Connection:
         """
-        Create and return SQLite database connection.
+        Create and return SQLite database connection tuned for bulk loading.
         
         Returns:
             sqlite3.Connection: Database connection object
         """
         self.logger.info(f"Creating database connection: {self.dw_path}")
         try:
-            conn = sqlite3.connect(self.dw_path)
-            conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+            is_new_database = not self.dw_path.exists()
+            # Autocommit mode: the ETL manages its single transaction explicitly
+            conn = sqlite3.connect(self.dw_path, autocommit=True)
+            
+            # Page size can only be chosen before the first write (and before WAL)
+            if is_new_database:
+                conn.execute("PRAGMA page_size = 8192")
+            
+            # WAL + synchronous=NORMAL avoids an fsync per commit; keep temp data,
+            # a 64MB page cache and a 256MB memory map in RAM
+            journal_mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -65536")
+            conn.execute("PRAGMA mmap_size = 268435456")
+            
+            # Foreign keys are not enforced per row during the bulk load; they are
+            # checked once by validate_data_warehouse instead
+            conn.execute("PRAGMA foreign_keys = OFF")
+            
+            self.logger.info(f"SQLite journal mode: {journal_mode}")
             return conn
         except Exception as e:
             self.logger.error(f"Error creating database connection: {e}")
             raise
     
+    def create_build_connection(self) -> sqlite3.Connection:
+        """
+        Create an in-memory database to build the warehouse in.
+        
+        An existing warehouse file is copied in first, so the load still adds to
+        whatever is already there.
+        
+        Returns:
+            sqlite3.Connection: In-memory database connection
+        """
+        self.logger.info("Creating in-memory build database")
+        conn = sqlite3.connect(":memory:", autocommit=True)
+        try:
+            # Match the page size of a new warehouse file so the final backup can
+            # write into a WAL database
+            conn.execute("PRAGMA page_size = 8192")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA foreign_keys = OFF")
+            
+            if self.dw_path.exists():
+                disk = self.create_connection()
+                try:
+                    disk.backup(conn)
+                finally:
+                    disk.close()
+            return conn
+        except Exception as e:
+            conn.close()
+            self.logger.error(f"Error creating build database: {e}")
+            raise
+    
+    def save_to_disk(self, conn: sqlite3.Connection) -> None:
+        """
+        Copy the finished in-memory warehouse to the warehouse file in one pass.
+        
+        Args:
+            conn (sqlite3.Connection): In-memory database connection
+        """
+        self.logger.info(f"Writing data warehouse to: {self.dw_path}")
+        disk = self.create_connection()
+        try:
+            conn.backup(disk)
+            self.use_rollback_journal(disk)
+        finally:
+            disk.close()
+    
+    def use_rollback_journal(self, conn: sqlite3.Connection) -> None:
+        """
+        Switch the finished warehouse file from WAL to rollback-journal mode.
+        
+        WAL only pays off while the load is writing. A rollback-journal file can
+        also be opened by read-only readers like Power BI, which cannot create the
+        -shm file WAL needs.
+        
+        Args:
+            conn (sqlite3.Connection): Warehouse file connection, outside a transaction
+        """
+        conn.execute("PRAGMA journal_mode = DELETE")
+    
     def create_dimension_tables(self, conn: sqlite3.Connection) -> None:
         """
         Create dimension tables for the star schema.
@@ -93,65 +325,7 @@ class VideoGameDataWarehouse:
             conn (sqlite3.Connection): Database connection
         """
         self.logger.info("Creating dimension tables...")
-        
-        # Platform Dimension
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS platform_dim (
-            platform_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            platform_name TEXT UNIQUE NOT NULL,
-            platform_category TEXT,
-            created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-        
-        # Genre Dimension
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS genre_dim (
-            genre_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            genre_name TEXT UNIQUE NOT NULL,
-            created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-        
-        # Publisher Dimension
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS publisher_dim (
-            publisher_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            publisher_name TEXT UNIQUE NOT NULL,
-            publisher_size_category TEXT,
-            created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-        
-        # Time Dimension
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS time_dim (
-            time_id INTEGER PRIMARY KEY,
-            year INTEGER NOT NULL,
-            decade INTEGER NOT NULL,
-            era TEXT NOT NULL,
-            created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-        
-        # Game Dimension (Degenerate dimension from fact table)
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS game_dim (
-            game_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            game_name TEXT NOT NULL,
-            platform_id INTEGER,
-            genre_id INTEGER,
-            publisher_id INTEGER,
-            release_year INTEGER,
-            success_category TEXT,
-            multi_region_success BOOLEAN,
-            created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (platform_id) REFERENCES platform_dim (platform_id),
-            FOREIGN KEY (genre_id) REFERENCES genre_dim (genre_id),
-            FOREIGN KEY (publisher_id) REFERENCES publisher_dim (publisher_id)
-        )
-        """)
-        
+        conn.executescript(DIMENSION_TABLES_SQL)
         self.logger.info("Dimension tables created successfully")
     
     def create_fact_table(self, conn: sqlite3.Connection) -> None:
@@ -162,257 +336,199 @@ class VideoGameDataWarehouse:
             conn (sqlite3.Connection): Database connection
         """
         self.logger.info("Creating fact table...")
-        
-        conn.execute("""
-        CREATE TABLE IF NOT EXISTS game_sales_fact (
-            fact_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            game_id INTEGER NOT NULL,
-            platform_id INTEGER NOT NULL,
-            genre_id INTEGER NOT NULL,
-            publisher_id INTEGER NOT NULL,
-            time_id INTEGER NOT NULL,
-            
-            -- Sales Metrics (Measures)
-            global_sales REAL NOT NULL,
-            na_sales REAL NOT NULL,
-            eu_sales REAL NOT NULL,
-            jp_sales REAL NOT NULL,
-            other_sales REAL NOT NULL,
-            
-            -- Derived Metrics
-            na_sales_pct REAL,
-            eu_sales_pct REAL,
-            jp_sales_pct REAL,
-            other_sales_pct REAL,
-            
-            -- Metadata
-            created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            
-            -- Foreign Key Constraints
-            FOREIGN KEY (game_id) REFERENCES game_dim (game_id),
-            FOREIGN KEY (platform_id) REFERENCES platform_dim (platform_id),
-            FOREIGN KEY (genre_id) REFERENCES genre_dim (genre_id),
-            FOREIGN KEY (publisher_id) REFERENCES publisher_dim (publisher_id),
-            FOREIGN KEY (time_id) REFERENCES time_dim (time_id),
-            
-            -- Composite unique constraint
-            UNIQUE (game_id, platform_id, genre_id, publisher_id, time_id)
-        )
-        """)
-        
+        conn.executescript(FACT_TABLE_SQL)
         self.logger.info("Fact table created successfully")
     
     def load_dimension_data(self, conn: sqlite3.Connection, df: pd.DataFrame) -> dict:
         """
-        Load data into dimension tables and return mapping dictionaries.
+        Load data into dimension tables and attach dimension IDs to the source rows.
+        
+        Platform, genre and publisher IDs are read back from their tables and added
+        to df as platform_id, genre_id and publisher_id columns.
         
         Args:
             conn (sqlite3.Connection): Database connection
-            df (pd.DataFrame): Cleaned source data
+            df (pd.DataFrame): Cleaned source data (ID columns are added in place)
             
         Returns:
-            dict: Dictionary with dimension ID mappings
+            dict: Dictionary with dimension ID mappings (name -> ID dicts for
+                platform/genre/publisher, a year -> time_id dict for time)
         """
         self.logger.info("Loading dimension data...")
         
         dimension_mappings = {}
         
-        # Load Platform Dimension
-        platforms = df['Platform'].unique()
-        platform_map = {}
-        for platform in platforms:
-            cursor = conn.execute(
-                "INSERT OR IGNORE INTO platform_dim (platform_name) VALUES (?)",
-                (platform,)
-            )
-            # Get the platform_id
-            if cursor.lastrowid:
-                platform_map[platform] = cursor.lastrowid
-            else:
-                # If row already exists, get existing ID
-                result = conn.execute(
-                    "SELECT platform_id FROM platform_dim WHERE platform_name = ?",
-                    (platform,)
-                ).fetchone()
-                platform_map[platform] = result[0] if result else None
-        
-        dimension_mappings['platform'] = platform_map
-        self.logger.info(f"Loaded {len(platform_map)} platforms")
-        
-        # Load Genre Dimension
-        genres = df['Genre'].unique()
-        genre_map = {}
-        for genre in genres:
-            cursor = conn.execute(
-                "INSERT OR IGNORE INTO genre_dim (genre_name) VALUES (?)",
-                (genre,)
-            )
-            if cursor.lastrowid:
-                genre_map[genre] = cursor.lastrowid
-            else:
-                result = conn.execute(
-                    "SELECT genre_id FROM genre_dim WHERE genre_name = ?",
-                    (genre,)
-                ).fetchone()
-                genre_map[genre] = result[0] if result else None
-        
-        dimension_mappings['genre'] = genre_map
-        self.logger.info(f"Loaded {len(genre_map)} genres")
-        
-        # Load Publisher Dimension
-        publishers = df['Publisher'].unique()
-        publisher_map = {}
-        for publisher in publishers:
-            cursor = conn.execute(
-                "INSERT OR IGNORE INTO publisher_dim (publisher_name) VALUES (?)",
-                (publisher,)
-            )
-            if cursor.lastrowid:
-                publisher_map[publisher] = cursor.lastrowid
-            else:
-                result = conn.execute(
-                    "SELECT publisher_id FROM publisher_dim WHERE publisher_name = ?",
-                    (publisher,)
-                ).fetchone()
-                publisher_map[publisher] = result[0] if result else None
-        
-        dimension_mappings['publisher'] = publisher_map
-        self.logger.info(f"Loaded {len(publisher_map)} publishers")
-        
-        # Load Time Dimension
-        time_map = {}
-        years = df['Year'].unique()
-        for year in years:
-            decade = (year // 10) * 10
-            era = self._get_era(year)
-            time_id = int(f"{year}")  # Simple time_id based on year
-            
-            cursor = conn.execute("""
-                INSERT OR IGNORE INTO time_dim (time_id, year, decade, era) 
-                VALUES (?, ?, ?, ?)
-            """, (time_id, year, decade, era))
-            
-            time_map[year] = time_id
+        # Load Platform, Genre and Publisher Dimensions
+        named_dimensions = [
+            ('platform', 'Platform', 'platforms'),
+            ('genre', 'Genre', 'genres'),
+            ('publisher', 'Publisher', 'publishers'),
+        ]
+        for dim, column, label in named_dimensions:
+            dimension_mappings[dim] = self._load_named_dimension(conn, df, dim, column)
+            self.logger.info(f"Loaded {df[column].nunique()} {label}")
+        
+        # Load Time Dimension - decade and era for every year in one vectorized pass
+        years = df['Year'].astype(int).unique()
+        decades = (years // 10) * 10
+        eras = np.select(
+            [years < 1990, years < 2000, years < 2010],
+            ['Pre-1990', '1990s', '2000s'],
+            default='2010s+',
+        )
+        time_ids = years.tolist()  # Simple time_id based on year
+        
+        conn.executemany("""
+            INSERT OR IGNORE INTO time_dim (time_id, year, decade, era) 
+            VALUES (?, ?, ?, ?)
+        """, zip(time_ids, years.tolist(), decades.tolist(), eras.tolist(), strict=True))
+        
+        time_map = dict(zip(time_ids, time_ids, strict=True))
         
         dimension_mappings['time'] = time_map
         self.logger.info(f"Loaded {len(time_map)} time periods")
         
         return dimension_mappings
     
-    def _get_era(self, year: int) -> str:
-        """Helper method to determine era based on year."""
-        if year < 1990:
-            return 'Pre-1990'
-        elif 1990 <= year < 2000:
-            return '1990s'
-        elif 2000 <= year < 2010:
-            return '2000s'
-        else:
-            return '2010s+'
-    
-    def load_game_dimension(self, conn: sqlite3.Connection, df: pd.DataFrame, dim_mappings: dict) -> dict:
+    def _load_named_dimension(
+        self, conn: sqlite3.Connection, df: pd.DataFrame, dim: str, column: str
+    ) -> dict:
         """
-        Load game dimension data and return game ID mappings.
+        Load one text column into its dimension table and add the matching IDs to df.
         
         Args:
             conn (sqlite3.Connection): Database connection
-            df (pd.DataFrame): Cleaned source data
-            dim_mappings (dict): Dimension ID mappings
+            df (pd.DataFrame): Cleaned source data (gets a <dim>_id column)
+            dim (str): Dimension name, e.g. 'platform' for platform_dim
+            column (str): Source column holding the dimension names
             
         Returns:
-            dict: Game ID mappings
+            dict: Mapping of dimension name to ID, as stored in the table
         """
-        self.logger.info("Loading game dimension data...")
-        
-        game_map = {}
+        # Names already in the table (from an earlier run or chunk) keep their IDs
+        select_sql, insert_sql = NAMED_DIMENSION_SQL[dim]
+        id_map = dict(conn.execute(select_sql))
+        
+        # Insert only the new names, in order of first appearance, so a fresh table
+        # numbers them that way. (INSERT OR IGNORE would still use up an AUTOINCREMENT
+        # value for every skipped row and leave gaps in the IDs.)
+        codes, names = pd.factorize(df[column])
+        names = names.tolist()
+        new_names = [name for name in names if name not in id_map]
+        if new_names:
+            conn.executemany(insert_sql, ((name,) for name in new_names))
+            # Read the IDs back in one query
+            id_map = dict(conn.execute(select_sql))
+        
+        name_ids = np.array([id_map[name] for name in names], dtype=np.int64)
+        df[f'{dim}_id'] = name_ids[codes]
+        return id_map
+    
+    def load_game_dimension(self, conn: sqlite3.Connection, df: pd.DataFrame, dim_mappings: dict) -> None:
+        """
+        Load game dimension data and attach the game ID to the source rows.
         
-        # Create a unique identifier for each game
-        for _, row in df.iterrows():
-            game_name = row['Name']
-            platform_id = dim_mappings['platform'].get(row['Platform'])
-            genre_id = dim_mappings['genre'].get(row['Genre'])
-            publisher_id = dim_mappings['publisher'].get(row['Publisher'])
-            
-            # Create composite key for game uniqueness
-            composite_key = f"{game_name}_{platform_id}_{genre_id}_{publisher_id}"
-            
-            if composite_key not in game_map:
-                cursor = conn.execute("""
-                    INSERT INTO game_dim (
-                        game_name, platform_id, genre_id, publisher_id, 
-                        release_year, success_category, multi_region_success
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    game_name, platform_id, genre_id, publisher_id,
-                    row['Year'], row.get('Success_Category', 'Unknown'),
-                    row.get('Multi_Region_Success', False)
-                ))
-                
-                game_map[composite_key] = cursor.lastrowid
+        Args:
+            conn (sqlite3.Connection): Database connection
+            df (pd.DataFrame): Cleaned source data with dimension ID columns
+                (gets a game_id column)
+            dim_mappings (dict): Dimension ID mappings
+        """
+        self.logger.info("Loading game dimension data...")
         
-        self.logger.info(f"Loaded {len(game_map)} unique games")
-        return game_map
+        keys = df[self.game_key]
+        game_ids = np.full(len(df), np.nan)
+        if self._loaded_games:
+            # Games already loaded from an earlier chunk keep their ID
+            game_ids[:] = [
+                self._loaded_games.get(key, np.nan) for key in keys.itertuples(index=False, name=None)
+            ]
+        new_games = np.isnan(game_ids)
+        
+        # A game is unique per name/platform/genre/publisher. Number new games in order
+        # of first appearance, after any already in the table, so the whole dimension
+        # goes in with one executemany
+        last_game_id = conn.execute("SELECT COALESCE(MAX(game_id), 0) FROM game_dim").fetchone()[0]
+        game_ids[new_games] = keys[new_games].groupby(self.game_key, sort=False).ngroup() + last_game_id + 1
+        df['game_id'] = game_ids.astype(np.int64)
+        games = df[new_games].drop_duplicates('game_id')
+        
+        # .tolist() hands sqlite3 plain Python scalars rather than NumPy ones
+        game_ids = games['game_id'].tolist()
+        names = games['Name'].tolist()
+        platform_ids = games['platform_id'].tolist()
+        genre_ids = games['genre_id'].tolist()
+        publisher_ids = games['publisher_id'].tolist()
+        success_categories = games['Success_Category'].tolist()
+        multi_region = games['Multi_Region_Success'].tolist()
+        
+        conn.executemany("""
+            INSERT INTO game_dim (
+                game_id, game_name, platform_id, genre_id, publisher_id,
+                release_year, success_category, multi_region_success
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, zip(
+            game_ids, names, platform_ids, genre_ids, publisher_ids,
+            games['Year'].tolist(), success_categories, multi_region,
+            strict=True,
+        ))
+        
+        # Only this chunk's new games are added, so the lookup grows in place
+        if self._loaded_games is not None:
+            self._loaded_games.update(zip(
+                games[self.game_key].itertuples(index=False, name=None), game_ids, strict=True
+            ))
+        
+        self.logger.info(f"Loaded {len(games)} unique games")
     
-    def load_fact_data(self, conn: sqlite3.Connection, df: pd.DataFrame, dim_mappings: dict, game_map: dict) -> None:
+    def load_fact_data(self, conn: sqlite3.Connection, df: pd.DataFrame, dim_mappings: dict) -> None:
         """
         Load sales data into fact table.
         
         Args:
             conn (sqlite3.Connection): Database connection
-            df (pd.DataFrame): Cleaned source data
+            df (pd.DataFrame): Cleaned source data with dimension and game ID columns
             dim_mappings (dict): Dimension ID mappings
-            game_map (dict): Game ID mappings
         """
         self.logger.info("Loading fact data...")
         
-        fact_count = 0
-        batch_size = 1000
-        batch_data = []
-        
-        for _, row in df.iterrows():
-            # Get dimension IDs
-            platform_id = dim_mappings['platform'].get(row['Platform'])
-            genre_id = dim_mappings['genre'].get(row['Genre'])
-            publisher_id = dim_mappings['publisher'].get(row['Publisher'])
-            time_id = dim_mappings['time'].get(row['Year'])
-            
-            # Get game_id using composite key
-            composite_key = f"{row['Name']}_{platform_id}_{genre_id}_{publisher_id}"
-            game_id = game_map.get(composite_key)
-            
-            if all([game_id, platform_id, genre_id, publisher_id, time_id]):
-                batch_data.append((
-                    game_id, platform_id, genre_id, publisher_id, time_id,
-                    row['Global_Sales'], row['NA_Sales'], row['EU_Sales'], 
-                    row['JP_Sales'], row['Other_Sales'],
-                    row.get('NA_Sales_Pct', 0), row.get('EU_Sales_Pct', 0),
-                    row.get('JP_Sales_Pct', 0), row.get('Other_Sales_Pct', 0)
-                ))
-                
-                fact_count += 1
-                
-                # Insert in batches for performance
-                if len(batch_data) >= batch_size:
-                    conn.executemany("""
-                        INSERT OR IGNORE INTO game_sales_fact (
-                            game_id, platform_id, genre_id, publisher_id, time_id,
-                            global_sales, na_sales, eu_sales, jp_sales, other_sales,
-                            na_sales_pct, eu_sales_pct, jp_sales_pct, other_sales_pct
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, batch_data)
-                    batch_data = []
-        
-        # Insert remaining records
-        if batch_data:
-            conn.executemany("""
-                INSERT OR IGNORE INTO game_sales_fact (
-                    game_id, platform_id, genre_id, publisher_id, time_id,
-                    global_sales, na_sales, eu_sales, jp_sales, other_sales,
-                    na_sales_pct, eu_sales_pct, jp_sales_pct, other_sales_pct
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, batch_data)
-        
-        self.logger.info(f"Loaded {fact_count} fact records")
+        # Build the fact rows as one frame whose columns match the INSERT order
+        fact = pd.DataFrame({
+            'game_id': df['game_id'],
+            'platform_id': df['platform_id'],
+            'genre_id': df['genre_id'],
+            'publisher_id': df['publisher_id'],
+            'time_id': df['Year'].map(dim_mappings['time']),
+        })
+        # Sales are float32 in memory; widen and round back to the source's hundredths
+        # so SQLite gets 0.1 rather than 0.10000000149011612
+        sales_columns = ['Global_Sales', 'NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales']
+        fact[[col.lower() for col in sales_columns]] = df[sales_columns].astype('float64').round(2)
+        pct_columns = ['NA_Sales_Pct', 'EU_Sales_Pct', 'JP_Sales_Pct', 'Other_Sales_Pct']
+        fact[[col.lower() for col in pct_columns]] = df[pct_columns]
+        
+        # Rows missing a dimension key were dropped in run_etl_pipeline, so every ID
+        # is set. Keep the first row per composite key within this frame; a full load
+        # only builds the unique index after the insert, while a chunked load creates
+        # it up front so INSERT OR IGNORE drops keys already loaded by earlier chunks
+        id_columns = ['game_id', 'platform_id', 'genre_id', 'publisher_id', 'time_id']
+        duplicates = fact.duplicated(subset=id_columns)
+        if duplicates.any():
+            self.logger.warning(f"Skipping {duplicates.sum()} fact rows with a duplicate composite key")
+            fact = fact[~duplicates]
+        
+        # One prepared statement for the whole table. itertuples yields plain Python
+        # scalars, so the ints are not stored as NumPy BLOBs. (pandas.to_sql is not used:
+        # it commits the ETL transaction and cannot express INSERT OR IGNORE.)
+        cursor = conn.executemany("""
+            INSERT OR IGNORE INTO game_sales_fact (
+                game_id, platform_id, genre_id, publisher_id, time_id,
+                global_sales, na_sales, eu_sales, jp_sales, other_sales,
+                na_sales_pct, eu_sales_pct, jp_sales_pct, other_sales_pct
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, fact.itertuples(index=False, name=None))
+        
+        self.logger.info(f"Loaded {cursor.rowcount} fact records")
     
     def create_indexes(self, conn: sqlite3.Connection) -> None:
         """
@@ -422,27 +538,7 @@ class VideoGameDataWarehouse:
             conn (sqlite3.Connection): Database connection
         """
         self.logger.info("Creating indexes...")
-        
-        # Fact table indexes
-        indexes = [
-            "CREATE INDEX IF NOT EXISTS idx_fact_game ON game_sales_fact(game_id)",
-            "CREATE INDEX IF NOT EXISTS idx_fact_platform ON game_sales_fact(platform_id)",
-            "CREATE INDEX IF NOT EXISTS idx_fact_genre ON game_sales_fact(genre_id)",
-            "CREATE INDEX IF NOT EXISTS idx_fact_publisher ON game_sales_fact(publisher_id)",
-            "CREATE INDEX IF NOT EXISTS idx_fact_time ON game_sales_fact(time_id)",
-            "CREATE INDEX IF NOT EXISTS idx_fact_global_sales ON game_sales_fact(global_sales)",
-            
-            # Dimension table indexes
-            "CREATE INDEX IF NOT EXISTS idx_platform_name ON platform_dim(platform_name)",
-            "CREATE INDEX IF NOT EXISTS idx_genre_name ON genre_dim(genre_name)",
-            "CREATE INDEX IF NOT EXISTS idx_publisher_name ON publisher_dim(publisher_name)",
-            "CREATE INDEX IF NOT EXISTS idx_time_year ON time_dim(year)",
-            "CREATE INDEX IF NOT EXISTS idx_game_name ON game_dim(game_name)",
-        ]
-        
-        for index_sql in indexes:
-            conn.execute(index_sql)
-        
+        conn.executescript(INDEXES_SQL)
         self.logger.info("Indexes created successfully")
     
     def validate_data_warehouse(self, conn: sqlite3.Connection) -> bool:
@@ -484,45 +580,186 @@ class VideoGameDataWarehouse:
             self.logger.warning(f"Found {orphan_count} orphaned fact records")
             return False
         
+        # Foreign keys are off during the load, so check all references in one pass
+        fk_violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+        if fk_violations:
+            self.logger.warning(f"Found {len(fk_violations)} foreign key violations")
+            return False
+        
         self.logger.info("Data warehouse validation passed")
         return True
     
-    def run_etl_pipeline(self) -> None:
+    def _derive_fact_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fill in any derived sales columns the cleaned data does not already carry.
+        
+        Uses the same rules as data_prep, computed on whole columns at once.
+        
+        Args:
+            df (pd.DataFrame): Cleaned source data
+            
+        Returns:
+            pd.DataFrame: Data with the sales percentage, success category and
+                multi-region columns present
+        """
+        region_cols = ['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales']
+        pct_columns = [f'{col}_Pct' for col in region_cols]
+        derived = {}
+        
+        regional = df[region_cols].to_numpy(dtype=np.float64)
+        global_sales = df['Global_Sales'].to_numpy(dtype=np.float64)
+        
+        if not set(pct_columns).issubset(df.columns):
+            # 0 where Global_Sales is 0, as in create_derived_features; dividing only
+            # the other rows avoids a warning and NaN
+            global_col = global_sales[:, None]
+            regional_pct = np.divide(
+                regional, global_col, out=np.zeros_like(regional), where=global_col != 0
+            )
+            derived.update(zip(pct_columns, regional_pct.T, strict=True))
+        
+        if 'Success_Category' not in df:
+            derived['Success_Category'] = np.select(
+                [global_sales >= 10, global_sales >= 5, global_sales >= 1],
+                ['Blockbuster (10M+)', 'Major Hit (5-10M)', 'Hit (1-5M)'],
+                default='Niche (<1M)',
+            )
+        
+        if 'Multi_Region_Success' not in df:
+            # Significant sales (over 100k units) in at least 2 regions
+            derived['Multi_Region_Success'] = np.count_nonzero(regional > 0.1, axis=1) >= 2
+        
+        if derived:
+            self.logger.info(f"Derived missing columns: {', '.join(derived)}")
+            df = df.assign(**derived)
+        return df
+    
+    def _use_parquet(self) -> bool:
+        """
+        Check whether the Parquet export should be read instead of the CSV.
+        
+        Returns:
+            bool: True if the Parquet file exists and is at least as new as the CSV
+        """
+        parquet_path = self.cleaned_parquet_path
+        return parquet_path.exists() and (
+            not self.cleaned_data_path.exists()
+            or parquet_path.stat().st_mtime >= self.cleaned_data_path.stat().st_mtime
+        )
+    
+    def load_cleaned_data(self) -> pd.DataFrame:
+        """
+        Load the cleaned data, preferring the Parquet export when it is up to date.
+        
+        Returns:
+            pd.DataFrame: Cleaned data with typed columns
+        """
+        if self._use_parquet():
+            self.logger.info(f"Loading cleaned data from: {self.cleaned_parquet_path}")
+            return pd.read_parquet(self.cleaned_parquet_path)
+        
+        self.logger.info(f"Loading cleaned data from: {self.cleaned_data_path}")
+        return pd.read_csv(self.cleaned_data_path, dtype=self.cleaned_dtypes)
+    
+    def load_cleaned_data_chunks(self, chunksize: int):
+        """
+        Stream the cleaned data in fixed-size chunks, preferring the Parquet export.
+        
+        Args:
+            chunksize (int): Number of rows per chunk
+            
+        Returns:
+            Iterator of pd.DataFrame chunks of cleaned data
+        """
+        if self._use_parquet():
+            self.logger.info(f"Streaming cleaned data from: {self.cleaned_parquet_path}")
+            batches = pq.ParquetFile(self.cleaned_parquet_path).iter_batches(batch_size=chunksize)
+            return (batch.to_pandas() for batch in batches)
+        
+        self.logger.info(f"Streaming cleaned data from: {self.cleaned_data_path}")
+        return pd.read_csv(self.cleaned_data_path, dtype=self.cleaned_dtypes, chunksize=chunksize)
+    
+    def _prepare_for_load(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop rows missing a dimension key and fill in missing derived columns.
+        
+        Args:
+            df (pd.DataFrame): Cleaned data (or chunk)
+            
+        Returns:
+            pd.DataFrame: Data ready for the dimension and fact loaders
+        """
+        # Drop rows missing a dimension key once, so the loaders can assume valid IDs
+        key_columns = ['Name', 'Platform', 'Genre', 'Publisher', 'Year']
+        loaded_rows = len(df)
+        df = df.dropna(subset=key_columns).reset_index(drop=True)
+        if len(df) < loaded_rows:
+            self.logger.warning(f"Dropped {loaded_rows - len(df):,} records missing a dimension key")
+        return self._derive_fact_columns(df)
+    
+    def run_etl_pipeline(self, chunksize: int | None = None) -> None:
         """
         Execute the complete ETL pipeline.
+        
+        By default the warehouse is built in memory and backed up to disk at the end.
+        With chunksize set, the cleaned data is streamed and the warehouse is built
+        straight into the file, so memory holds one chunk plus one game_id lookup
+        entry per distinct game rather than the whole warehouse.
+        
+        Args:
+            chunksize (int): If set, stream the cleaned data in chunks of this many
+                rows instead of loading it all at once
         """
         self.logger.info("Starting ETL pipeline to data warehouse...")
         
         # Check if cleaned data exists
-        if not self.cleaned_data_path.exists():
+        if not (self.cleaned_data_path.exists() or self.cleaned_parquet_path.exists()):
             self.logger.error(f"Cleaned data file not found: {self.cleaned_data_path}")
             self.logger.error("Please run data_preparation.py first")
             raise FileNotFoundError(f"Cleaned data file not found: {self.cleaned_data_path}")
         
+        # Only a chunked load needs to find games loaded by an earlier chunk
+        self._loaded_games = None if chunksize is None else {}
+        
         conn = None
         try:
-            # Load cleaned data
-            self.logger.info(f"Loading cleaned data from: {self.cleaned_data_path}")
-            df = pd.read_csv(self.cleaned_data_path)
-            self.logger.info(f"Loaded {len(df):,} records for ETL processing")
+            # Load cleaned data whole and build in memory (the file is only written once
+            # the load succeeds), or stream chunks straight into the WAL-mode file
+            if chunksize is None:
+                chunks = [self.load_cleaned_data()]
+                conn = self.create_build_connection()
+            else:
+                chunks = self.load_cleaned_data_chunks(chunksize)
+                conn = self.create_connection()
             
-            # Create database connection
-            conn = self.create_connection()
+            # Run the whole load (DDL, inserts, indexes, validation) in one transaction
+            conn.execute("BEGIN IMMEDIATE")
             
             # Step 1: Create dimension tables
             self.create_dimension_tables(conn)
             
             # Step 2: Create fact table
             self.create_fact_table(conn)
+            if chunksize is not None:
+                # Later chunks can repeat a composite key; let the index drop them
+                conn.executescript(FACT_UNIQUE_INDEX_SQL)
             
-            # Step 3: Load dimension data
-            dim_mappings = self.load_dimension_data(conn, df)
-            
-            # Step 4: Load game dimension
-            game_map = self.load_game_dimension(conn, df, dim_mappings)
+            # Steps 3-5 run per chunk; each chunk's dimension rows go in before its facts
+            total_records = 0
+            for chunk in chunks:
+                df = self._prepare_for_load(chunk)
+                total_records += len(df)
+                
+                # Step 3: Load dimension data
+                dim_mappings = self.load_dimension_data(conn, df)
+                
+                # Step 4: Load game dimension
+                self.load_game_dimension(conn, df, dim_mappings)
+                
+                # Step 5: Load fact data
+                self.load_fact_data(conn, df, dim_mappings)
             
-            # Step 5: Load fact data
-            self.load_fact_data(conn, df, dim_mappings, game_map)
+            self.logger.info(f"Processed {total_records:,} records for ETL")
             
             # Step 6: Create indexes
             self.create_indexes(conn)
@@ -530,14 +767,26 @@ class VideoGameDataWarehouse:
             # Step 7: Validate
             self.validate_data_warehouse(conn)
             
-            # Commit all changes
-            conn.commit()
+            # Step 8: Gather planner statistics so report queries pick the new indexes
+            conn.execute("ANALYZE")
+            conn.execute("PRAGMA optimize")
+            
+            # Commit all changes in one go
+            conn.execute("COMMIT")
+            
+            # Step 9: Copy the finished in-memory warehouse to disk; either way the
+            # file is left in rollback-journal mode
+            if chunksize is None:
+                self.save_to_disk(conn)
+            else:
+                self.use_rollback_journal(conn)
             
             self.logger.info("ETL pipeline completed successfully!")
             
         except Exception as e:
-            if conn:
-                conn.rollback()
+            # rollback() is a no-op in autocommit mode, so end the transaction by hand
+            if conn and conn.in_transaction:
+                conn.execute("ROLLBACK")
             self.logger.error(f"ETL pipeline failed: {e}")
             raise
         finally:
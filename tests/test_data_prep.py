@@ -0,0 +1,130 @@
+"""Test the data preparation module.
+
+Module Information:
+    - Filename: test_data_prep.py
+    - Module: test_data_prep
+    - Location: tests/
+
+These tests run the pipeline against a temporary copy of the raw data so
+the prepared files tracked in the repository are left untouched.
+"""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from analytics_project import data_prep
+
+RAW_DATA = Path(__file__).parent.parent / "data" / "raw" / "vgsales.csv"
+
+
+def make_preparer(tmp_path, **kwargs):
+    """Create a preparer whose data directory lives under tmp_path."""
+    raw_dir = tmp_path / "data" / "raw"
+    raw_dir.mkdir(parents=True)
+    shutil.copy(RAW_DATA, raw_dir / "vgsales.csv")
+    return data_prep.VideoGameDataPreparer(data_dir=tmp_path, **kwargs)
+
+
+def test_parquet_export_keeps_dtypes(tmp_path):
+    """Verify the Parquet export round-trips categories and downcast numerics."""
+    preparer = make_preparer(tmp_path, output_format="parquet")
+    df = preparer.run_pipeline()
+
+    assert preparer.prepared_data_path.suffix == ".parquet"
+    exported = pd.read_parquet(preparer.prepared_data_path)
+    assert len(exported) == len(df)
+    assert isinstance(exported["Genre"].dtype, pd.CategoricalDtype)
+    assert exported["Global_Sales"].dtype == "float32"
+
+
+def test_unknown_output_format_rejected(tmp_path):
+    """Verify an unsupported output format fails fast."""
+    with pytest.raises(ValueError):
+        data_prep.VideoGameDataPreparer(data_dir=tmp_path, output_format="xlsx")
+
+
+def test_chunked_pipeline_matches_full_load(tmp_path):
+    """Verify cleaning in chunks gives the same data as a single full load."""
+    preparer = make_preparer(tmp_path)
+    full = preparer.run_pipeline()
+    chunked = preparer.run_pipeline(chunksize=5000, use_cache=False)
+
+    assert len(chunked) == len(full)
+    assert isinstance(chunked["Platform"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(
+        chunked.astype(str), full.reset_index(drop=True).astype(str)
+    )
+
+
+def test_unchanged_raw_data_reuses_export(tmp_path):
+    """Verify a re-run with the same raw file skips the pipeline and reads the export."""
+    preparer = make_preparer(tmp_path)
+    first = preparer.run_pipeline()
+    exported_at = preparer.prepared_data_path.stat().st_mtime_ns
+
+    assert preparer.load_cached_data() is not None
+    cached = preparer.run_pipeline()
+    assert preparer.prepared_data_path.stat().st_mtime_ns == exported_at
+    assert len(cached) == len(first)
+    assert isinstance(cached["Genre"].dtype, pd.CategoricalDtype)
+    for col in preparer._plan.export_dtypes:
+        assert cached[col].dtype.name == first[col].dtype.name, col
+
+    # Any change to the raw file invalidates the cache
+    with preparer.raw_data_path.open("a") as raw:
+        raw.write("\n")
+    assert preparer.load_cached_data() is None
+
+
+def test_quality_check_recomputes_regional_sums_for_other_frames(tmp_path):
+    """Verify a frame the pipeline did not produce is not checked against stale sums."""
+    preparer = make_preparer(tmp_path)
+    df = preparer.run_pipeline(use_cache=False)
+
+    sample = df.head(10).copy()
+    sample["NA_Sales"] += 5
+    assert preparer._count_inconsistent_records(sample) == 10
+
+
+def test_quality_check_tolerates_one_rounding_unit(tmp_path):
+    """Verify totals off by exactly 0.01 pass while larger gaps are flagged."""
+    preparer = data_prep.VideoGameDataPreparer(data_dir=tmp_path)
+    df = pd.DataFrame({
+        "NA_Sales": [0.29, 0.29, 0.29],
+        "EU_Sales": [0.0, 0.0, 0.0],
+        "JP_Sales": [0.0, 0.0, 0.0],
+        "Other_Sales": [0.0, 0.0, 0.0],
+        "Global_Sales": [0.29, 0.3, 0.31],
+    }).astype("float32")
+    assert preparer._count_inconsistent_records(df) == 1
+
+
+def test_missing_platform_does_not_abort_pipeline(tmp_path):
+    """Verify a raw row with an empty Platform is cleaned in both read paths."""
+    preparer = make_preparer(tmp_path)
+    raw = pd.read_csv(preparer.raw_data_path)
+    raw.loc[0, "Platform"] = None
+    raw.to_csv(preparer.raw_data_path, index=False)
+
+    full = preparer.run_pipeline(use_cache=False)
+    chunked = preparer.run_pipeline(chunksize=5000, use_cache=False)
+    assert full["Platform"].isna().sum() == 1
+    assert chunked["Platform"].isna().sum() == 1
+
+
+def test_non_numeric_year_and_sales_are_coerced(tmp_path):
+    """Verify one bad Year or sales cell is dropped or zero-filled in both read paths."""
+    preparer = make_preparer(tmp_path)
+    baseline = preparer.run_pipeline(use_cache=False)
+    raw = pd.read_csv(preparer.raw_data_path, dtype=str)
+    raw.loc[0, "Year"] = "TBD"
+    raw.loc[1, "EU_Sales"] = "n.a."
+    raw.to_csv(preparer.raw_data_path, index=False)
+
+    for chunksize in (None, 5000):
+        df = preparer.run_pipeline(chunksize=chunksize, use_cache=False)
+        assert len(df) == len(baseline) - 1
+        assert raw.loc[1, "Name"] in set(df.loc[df["EU_Sales"] == 0, "Name"])
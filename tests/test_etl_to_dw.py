@@ -0,0 +1,162 @@
+"""Test the ETL to data warehouse module.
+
+Module Information:
+    - Filename: test_etl_to_dw.py
+    - Module: test_etl_to_dw
+    - Location: tests/
+
+These tests load a temporary copy of the prepared data so the data
+warehouse tracked in the repository is left untouched.
+"""
+
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from analytics_project import etl_to_dw
+
+PREPARED_DATA = Path(__file__).parent.parent / "data" / "prepared" / "vgsales_cleaned.csv"
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    """Create a warehouse whose data directory lives under tmp_path."""
+    prepared_dir = tmp_path / "data" / "prepared"
+    prepared_dir.mkdir(parents=True)
+    shutil.copy(PREPARED_DATA, prepared_dir / "vgsales_cleaned.csv")
+    return etl_to_dw.VideoGameDataWarehouse(data_dir=tmp_path)
+
+
+def test_etl_pipeline_builds_star_schema(warehouse):
+    """Verify the ETL loads every dimension and the fact table consistently."""
+    warehouse.run_etl_pipeline()
+
+    conn = sqlite3.connect(warehouse.dw_path)
+    try:
+        counts = conn.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM platform_dim),
+                (SELECT COUNT(*) FROM genre_dim),
+                (SELECT COUNT(*) FROM publisher_dim),
+                (SELECT COUNT(*) FROM time_dim),
+                (SELECT COUNT(*) FROM game_dim),
+                (SELECT COUNT(*) FROM game_sales_fact)
+        """).fetchone()
+        assert all(count > 0 for count in counts)
+        assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+        # Built in memory and backed up, so the file is left in rollback-journal mode
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        # ANALYZE ran, so the query planner has statistics for the fact table
+        assert conn.execute(
+            "SELECT COUNT(*) FROM sqlite_stat1 WHERE tbl = 'game_sales_fact'"
+        ).fetchone()[0] > 0
+    finally:
+        conn.close()
+
+
+def test_etl_reads_parquet_export(warehouse):
+    """Verify the ETL loads a Parquet export and keeps the source's sales values."""
+    csv_path = warehouse.cleaned_data_path
+    pd.read_csv(csv_path, dtype=warehouse.cleaned_dtypes).to_parquet(
+        warehouse.cleaned_parquet_path, index=False
+    )
+    csv_path.unlink()
+    warehouse.run_etl_pipeline()
+
+    conn = sqlite3.connect(warehouse.dw_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM game_sales_fact").fetchone()[0] > 0
+        # float32 sales are rounded back to hundredths before they reach SQLite
+        assert conn.execute("SELECT MAX(global_sales) FROM game_sales_fact").fetchone()[0] == 82.74
+    finally:
+        conn.close()
+
+
+def test_missing_derived_columns_are_filled(warehouse):
+    """Verify data without the derived columns gets them computed for the load."""
+    df = pd.DataFrame({
+        "NA_Sales": [6.0, 0.05, 0.0, -0.1],
+        "EU_Sales": [4.0, 0.2, 0.0, 0.0],
+        "JP_Sales": [0.0, 0.0, 0.0, 0.0],
+        "Other_Sales": [2.0, 0.25, 0.0, 0.0],
+        "Global_Sales": [12.0, 0.5, 0.0, -0.2],
+    })
+    derived = warehouse._derive_fact_columns(df)
+
+    # Only a zero total gives 0, matching data_prep.create_derived_features
+    assert derived["NA_Sales_Pct"].tolist() == [0.5, 0.1, 0.0, 0.5]
+    assert derived["Success_Category"].tolist() == [
+        "Blockbuster (10M+)", "Niche (<1M)", "Niche (<1M)", "Niche (<1M)"
+    ]
+    assert derived["Multi_Region_Success"].tolist() == [True, True, False, False]
+
+
+def test_existing_dimension_rows_keep_their_ids(warehouse):
+    """Verify facts point at the stored dimension IDs when a table is already populated."""
+    conn = warehouse.create_connection()
+    warehouse.create_dimension_tables(conn)
+    conn.execute("INSERT INTO platform_dim (platform_name) VALUES ('Legacy Console')")
+    conn.close()
+
+    warehouse.run_etl_pipeline()
+
+    conn = sqlite3.connect(warehouse.dw_path)
+    try:
+        platform = conn.execute("""
+            SELECT p.platform_name
+            FROM game_sales_fact f
+            JOIN game_dim g USING (game_id)
+            JOIN platform_dim p ON p.platform_id = f.platform_id
+            WHERE g.game_name = 'Wii Sports'
+        """).fetchone()[0]
+        assert platform == "Wii"
+    finally:
+        conn.close()
+
+
+def test_rows_missing_a_dimension_key_are_dropped(warehouse):
+    """Verify records without a publisher are skipped rather than loaded with a bad ID."""
+    df = pd.read_csv(warehouse.cleaned_data_path).head(50)
+    df.loc[0, "Publisher"] = None
+    df.to_csv(warehouse.cleaned_data_path, index=False)
+
+    warehouse.run_etl_pipeline()
+
+    conn = sqlite3.connect(warehouse.dw_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM game_sales_fact").fetchone()[0] == 49
+        assert conn.execute(
+            "SELECT COUNT(*) FROM game_dim WHERE game_name = ?", (df.loc[0, "Name"],)
+        ).fetchone()[0] == 0
+    finally:
+        conn.close()
+
+
+def test_chunked_etl_matches_full_load(warehouse, tmp_path):
+    """Verify streaming the cleaned data in chunks builds the same warehouse."""
+    chunked_dir = tmp_path / "chunked"
+    (chunked_dir / "data" / "prepared").mkdir(parents=True)
+    shutil.copy(warehouse.cleaned_data_path, chunked_dir / "data" / "prepared" / "vgsales_cleaned.csv")
+    chunked = etl_to_dw.VideoGameDataWarehouse(data_dir=chunked_dir)
+
+    warehouse.run_etl_pipeline()
+    chunked.run_etl_pipeline(chunksize=3000)
+
+    queries = [
+        "SELECT game_id, game_name, platform_id, genre_id, publisher_id FROM game_dim ORDER BY game_id",
+        "SELECT game_id, platform_id, time_id, global_sales FROM game_sales_fact ORDER BY fact_id",
+        "SELECT platform_id, platform_name FROM platform_dim ORDER BY platform_id",
+    ]
+    full_conn = sqlite3.connect(warehouse.dw_path)
+    chunked_conn = sqlite3.connect(chunked.dw_path)
+    try:
+        for query in queries:
+            assert chunked_conn.execute(query).fetchall() == full_conn.execute(query).fetchall()
+        # Both build paths leave the file readable without a WAL -shm file
+        assert chunked_conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    finally:
+        full_conn.close()
+        chunked_conn.close()